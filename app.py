@@ -1,10 +1,31 @@
-from flask import Flask, request, jsonify, render_template
-from datetime import datetime, timezone, timedelta
+# Patch sockets and threading before anything opens a connection, so blocking
+# YouTube calls yield to other greenlets instead of stalling the worker
+from gevent import monkey
+
+monkey.patch_all()
+
+from flask import Flask, Response, request, render_template
+import calendar
+import functools
+import heapq
+import itertools
 import googleapiclient.discovery
 import googleapiclient.errors
+import googleapiclient.http
+import googleapiclient.model
+import httplib2
 import os
 import logging
-from cachetools import cached, TTLCache
+import orjson
+import queue
+import re
+import requests
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
+from urllib3.util.retry import Retry
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 # Set up logging
@@ -20,90 +41,421 @@ app.wsgi_app = ProxyFix(
     app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1
 )
 
+
+def ojson(payload, status=200):
+    """Build a JSON response with orjson instead of Flask's jsonify."""
+
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+class RequestsHttp:
+    """Minimal httplib2.Http stand-in backed by a pooled requests.Session.
+
+    httplib2 opens a fresh TLS connection per call and isn't thread-safe, so
+    googleapiclient is handed this instead. Only the ``request`` signature the
+    client actually uses is implemented.
+    """
+
+    def __init__(self, session, timeout=10):
+        self.session = session
+        self.timeout = timeout
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=None, connection_type=None):
+        try:
+            response = self.session.request(method, uri, data=body, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            # Report transport failures as a gateway error response so callers
+            # get the same HttpError they already handle
+            logger.error(f"Request to {uri} failed: {e}")
+            status = 504 if isinstance(e, requests.Timeout) else 503
+            resp = httplib2.Response({"status": str(status), "content-type": "application/json"})
+            resp.reason = "Gateway Timeout" if status == 504 else "Service Unavailable"
+            return resp, orjson.dumps({"error": {"code": status, "message": str(e)}})
+
+        info = {key.lower(): value for key, value in response.headers.items()}
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        self.session.close()
+
+
+class FastJsonModel(googleapiclient.model.JsonModel):
+    """JsonModel that decodes API responses with orjson."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel, which hands back undecodable bodies as-is
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+
 youtube = googleapiclient.discovery.build(
-    api_service_name, api_version, developerKey=os.environ.get("GOOGLE_API_KEY")
+    api_service_name,
+    api_version,
+    developerKey=os.environ.get("GOOGLE_API_KEY"),
+    http=RequestsHttp(session),
+    model=FastJsonModel(),
 )
 
 
-@cached(cache=TTLCache(maxsize=512, ttl=timedelta(hours=12), timer=datetime.now))
-def get_channel_id_from_handle(handle):
-    """Get the channel ID from a YouTube channel handle."""
+class TTLStore:
+    """A bounded map of ``(value, expiry)`` pairs with lock-free reads.
+
+    Writes take ``shared_lock``. A heap of expiries finds expired entries
+    without scanning the whole store; if none have expired, the entry
+    stored longest ago is evicted. Storing a key again makes it the newest.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self._expiries = []
+        self._counter = itertools.count()
+
+    def get(self, key):
+        """Get a live value, or None."""
+
+        entry = self.entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        return None
+
+    def ttl_left(self, key):
+        """Get the seconds left before an entry expires, or 0."""
+
+        entry = self.entries.get(key)
+        return max(0, entry[1] - time.monotonic()) if entry is not None else 0
+
+    def set(self, key, value, ttl_seconds):
+        """Store a value for ``ttl_seconds``."""
+
+        with shared_lock:
+            now = time.monotonic()
+            self.entries.pop(key, None)
+            if len(self.entries) >= self.maxsize:
+                self._evict(now)
+            expiry = now + ttl_seconds
+            self.entries[key] = (value, expiry)
+            heapq.heappush(self._expiries, (expiry, next(self._counter), key))
+            if len(self._expiries) > 2 * self.maxsize:
+                # Drop heap records left behind by replaced or removed keys
+                self._expiries = [(e, next(self._counter), k) for k, (_, e) in self.entries.items()]
+                heapq.heapify(self._expiries)
+
+    def remove_if(self, predicate):
+        """Remove entries for which ``predicate(key, value)`` is true; caller holds the lock."""
+
+        stale = [key for key, (value, _) in self.entries.items() if predicate(key, value)]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+    def _evict(self, now):
+        while self._expiries and self._expiries[0][0] <= now:
+            expiry, _, key = heapq.heappop(self._expiries)
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] == expiry:
+                del self.entries[key]
+        while len(self.entries) >= self.maxsize:
+            self.entries.popitem(last=False)
+
+
+shared_lock = threading.Lock()
+pending_calls = {}
+
+# One cache shared by every memoized function, keyed by (name, args). Failed
+# lookups get their own smaller store so probes for bad handles can't push
+# out long-lived results
+SHARED = TTLStore(maxsize=4096)
+NEGATIVE = TTLStore(maxsize=1024)
+
+
+class PendingCall:
+    """An in-flight memoized call that other callers for its key wait on."""
+
+    __slots__ = ("event", "value", "done")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.done = False
+
+
+def mentions_channel(key, value, channel_id):
+    """Check whether a shared cache entry belongs to a channel ID."""
+
+    if channel_id in key[1]:
+        return True
+    if not isinstance(value, tuple):
+        return False
+    # Results such as (channel_id, info, error) or (payload, status, ttl)
+    return any(
+        part == channel_id or (isinstance(part, dict) and part.get("channel_id") == channel_id)
+        for part in value
+    )
 
-    # Check if the handle starts with '@'
-    if not handle.startswith("@"):
-        logger.error("Invalid handle format. It should start with '@'.")
-        return None, "Invalid handle format. It should start with '@'."
 
-    logger.debug(f"Fetching channel ID for handle: {handle}")
+def invalidate(channel_id):
+    """Drop every cached entry whose arguments or result mention a channel ID."""
+
+    def matches(key, value):
+        return mentions_channel(key, value, channel_id)
+
+    with shared_lock:
+        removed = SHARED.remove_if(matches) + NEGATIVE.remove_if(matches)
+    logger.debug(f"Invalidated {removed} cached entr(ies) for {channel_id}")
+
+
+def memoize(ttl_seconds, name=None, cache_if=None):
+    """Cache a function's results in the shared cache.
+
+    ``ttl_seconds`` is a number or a callable taking the result and returning
+    its TTL. A hit is one dict lookup and a float compare; the lock is only
+    taken on a miss, where concurrent callers for the same key share one
+    call. Results for which ``cache_if`` returns false are not stored.
+    ``wrapper.ttl_left(*args)`` gives the seconds left on a cached result.
+    """
+
+    def decorator(func):
+        prefix = name or func.__name__
+        ttl = ttl_seconds if callable(ttl_seconds) else (lambda _result: ttl_seconds)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (prefix, args)
+            entry = SHARED.entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+
+            while True:
+                with shared_lock:
+                    entry = SHARED.entries.get(key)
+                    if entry is not None and entry[1] > time.monotonic():
+                        return entry[0]
+                    call = pending_calls.get(key)
+                    if call is None:
+                        call = pending_calls[key] = PendingCall()
+                        break
+                # Another caller is fetching this key. Share its result even
+                # if it wasn't cached; only retry if it raised
+                call.event.wait()
+                if call.done:
+                    return call.value
+
+            try:
+                value = func(*args)
+                if cache_if is None or cache_if(value):
+                    SHARED.set(key, value, ttl(value))
+                call.value, call.done = value, True
+                return value
+            finally:
+                with shared_lock:
+                    del pending_calls[key]
+                call.event.set()
+
+        wrapper.ttl_left = lambda *args: SHARED.ttl_left((prefix, args))
+        return wrapper
+
+    return decorator
+
+
+# Partial-response masks so the API only sends the fields we read
+CHANNEL_FIELDS = "items(id,snippet(title,thumbnails/medium))"
+VIDEO_FIELDS = "items(id,liveStreamingDetails(actualStartTime,actualEndTime,scheduledStartTime))"
+
+
+class ChannelBatcher:
+    """Coalesce concurrent channel ID lookups into batched channels.list calls.
+
+    Lookups arriving within ``window`` seconds of each other are sent as a
+    single request of up to ``max_batch`` IDs, and each waiter is woken with
+    its own item. Each batch is sent on its own thread so a slow request
+    doesn't hold up the next window, and waiters give up after
+    ``wait_timeout`` seconds.
+    """
+
+    def __init__(self, window=0.02, max_batch=50, wait_timeout=60):
+        self.window = window
+        self.max_batch = max_batch
+        self.wait_timeout = wait_timeout
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def get(self, channel_id):
+        """Return the (item, error, http_status) triple for a single channel ID."""
+
+        self._ensure_started()
+        waiter = {"id": channel_id, "event": threading.Event(), "item": None, "error": None, "status": None}
+        self._queue.put(waiter)
+        if not waiter["event"].wait(self.wait_timeout):
+            logger.error(f"Timed out waiting for batched lookup of {channel_id}")
+            return None, "Timed out waiting for channel lookup", None
+        return waiter["item"], waiter["error"], waiter["status"]
+
+    def _ensure_started(self):
+        # Started lazily so forking servers don't inherit a dead thread
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="channel-batcher", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            threading.Thread(target=self._dispatch, args=(batch,), name="channel-batch", daemon=True).start()
+
+    def _dispatch(self, batch):
+        ids = list(dict.fromkeys(waiter["id"] for waiter in batch))
+        logger.debug(f"Fetching channel info for {len(ids)} ID(s) in one batch")
+
+        items, error, status = {}, None, None
+        try:
+            request = youtube.channels().list(part="snippet", id=",".join(ids), fields=CHANNEL_FIELDS)
+            response = request.execute()
+            items = {item["id"]: item for item in response.get("items", [])}
+        except googleapiclient.errors.HttpError as e:
+            logger.error(f"HTTP error occurred: {e}")
+            error, status = f"HTTP error occurred: {e}", e.resp.status
+        except Exception as e:
+            logger.exception("Batched channel lookup failed")
+            error = f"Channel lookup failed: {e}"
+
+        for waiter in batch:
+            waiter["item"] = items.get(waiter["id"])
+            waiter["error"] = error
+            waiter["status"] = status
+            waiter["event"].set()
+
+
+channel_batcher = ChannelBatcher()
+
+
+def _channel_info(item):
+    """Build the channel info dict from a channels.list item."""
+
+    snippet = item.get("snippet", {})
+    return {
+        "channel_name": snippet.get("title", item["id"]),
+        "profile_pic": snippet.get("thumbnails", {}).get("medium", {}),
+    }
 
-    # Prepare the request to get channel ID by handle
 
-    args = {"part": "id", "forHandle": handle}
-    try:
-        request = youtube.channels().list(**args)
-        response = request.execute()
-    except googleapiclient.errors.HttpError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        return None, f"HTTP error occurred: {e}"
+# Bare channel IDs share batched requests, so only well-formed ones get in
+CHANNEL_ID_RE = re.compile(r"UC[A-Za-z0-9_-]{22}")
 
-    if not response.get("items"):
-        logger.warning("Channel not found or no items returned")
-        return None, "Channel not found or no items returned"
+NegativeResult = namedtuple("NegativeResult", ["error"])
 
-    channel_id = response["items"][0]["id"]
-    logger.debug(f"Channel ID for handle {handle} is {channel_id}")
+# Seconds to remember failed channel lookups, by HTTP status
+NEGATIVE_TTLS = {403: 30 * 60, 429: 30 * 60, 404: 24 * 3600}
+NOT_FOUND_TTL = 3600
 
-    # Return the channel ID
-    return response["items"][0]["id"], None
 
+def remember_failure(channel, error, ttl):
+    """Cache a failed lookup so repeats don't spend quota until it expires."""
 
-@cached(cache=TTLCache(maxsize=512, ttl=timedelta(hours=12), timer=datetime.now))
-def get_channel_id_from_username(username):
-    """Get the channel ID from a YouTube channel username."""
+    logger.debug(f"Caching failed lookup for {channel} for {ttl}s")
+    NEGATIVE.set(("negative", (channel,)), NegativeResult(error), ttl)
 
-    logger.debug(f"Fetching channel ID for username: {username}")
 
-    # Prepare the request to get channel ID by username
-    args = {"part": "id", "forUsername": username}
-    try:
-        request = youtube.channels().list(**args)
-        response = request.execute()
-    except googleapiclient.errors.HttpError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        return None, f"HTTP error occurred: {e}"
-
-    if not response.get("items"):
-        logger.warning("Channel not found or no items returned")
-        return None, "Channel not found or no items returned"
+@memoize(12 * 3600, cache_if=lambda result: result[2] is None)
+def resolve_channel(channel):
+    """Resolve a channel ID, handle or username to its ID and channel info.
 
-    channel_id = response["items"][0]["id"]
-    logger.debug(f"Channel ID for username {username} is {channel_id}")
+    Returns a ``(channel_id, info, error)`` tuple. Handles and usernames are
+    resolved with a single ``part=id,snippet`` request; bare channel IDs go
+    through the batcher so concurrent lookups share one request.
+    """
 
-    # Return the channel ID
-    return channel_id, None
-
-
-def get_channel_id(channel):
-    """Get the channel ID from a channel name or handle."""
+    negative = NEGATIVE.get(("negative", (channel,)))
+    if negative:
+        logger.debug(f"Using cached failure for {channel}")
+        return None, None, negative.error
 
     if channel.startswith("UC"):
         logger.debug(f"Channel ID provided: {channel}")
-        return channel
-    elif channel.startswith("@"):
-        logger.debug(f"Channel handle provided: {channel}")
-        return get_channel_id_from_handle(channel)
+        if not CHANNEL_ID_RE.fullmatch(channel):
+            logger.warning(f"Invalid channel ID: {channel}")
+            return None, None, "Invalid channel ID"
+        item, error, status = channel_batcher.get(channel)
     else:
-        logger.debug(f"Channel username provided: {channel}")
-        return get_channel_id_from_username(channel)
+        if channel.startswith("@"):
+            logger.debug(f"Channel handle provided: {channel}")
+            args = {"part": "id,snippet", "forHandle": channel, "fields": CHANNEL_FIELDS}
+        else:
+            logger.debug(f"Channel username provided: {channel}")
+            args = {"part": "id,snippet", "forUsername": channel, "fields": CHANNEL_FIELDS}
+
+        item, error, status = None, None, None
+        try:
+            request = youtube.channels().list(**args)
+            response = request.execute()
+        except googleapiclient.errors.HttpError as e:
+            logger.error(f"HTTP error occurred: {e}")
+            error, status = f"HTTP error occurred: {e}", e.resp.status
+        else:
+            items = response.get("items")
+            item = items[0] if items else None
+
+    if error:
+        if status in NEGATIVE_TTLS:
+            remember_failure(channel, error, NEGATIVE_TTLS[status])
+        return None, None, error
+
+    if not item:
+        logger.warning("Channel not found or no items returned")
+        error = "Channel not found or no items returned"
+        remember_failure(channel, error, NOT_FOUND_TTL)
+        return None, None, error
+
+    info = _channel_info(item)
+    logger.debug(f"Resolved {channel} to {item['id']} ({info['channel_name']})")
+
+    return item["id"], info, None
 
 
-@cached(cache=TTLCache(maxsize=512, ttl=timedelta(hours=12), timer=datetime.now))
-def get_channel_info(channel_id):
-    """Get channel information from YouTube API using channel ID."""
+@memoize(24 * 3600, cache_if=lambda result: result[1] is None)
+def get_uploads_playlist_id(channel_id):
+    """Get the ID of a channel's uploads playlist."""
 
-    logger.debug(f"Fetching channel info for ID: {channel_id}")
+    logger.debug(f"Fetching uploads playlist for channel ID: {channel_id}")
 
-    args = {"part": "snippet", "id": channel_id}
+    args = {
+        "part": "contentDetails",
+        "id": channel_id,
+        "fields": "items/contentDetails/relatedPlaylists/uploads",
+    }
     try:
         request = youtube.channels().list(**args)
         response = request.execute()
@@ -115,137 +467,196 @@ def get_channel_info(channel_id):
         logger.warning("Channel not found or no items returned")
         return None, "Channel not found or no items returned"
 
-    info = {
-        "channel_name": response["items"][0]["snippet"].get("title", channel_id),
-        "profile_pic": response["items"][0]["snippet"]
-        .get("thumbnails", {})
-        .get("medium", {}),
-    }
+    return response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"], None
 
-    logger.debug(f"Got channel info for : {info['channel_name']}")
 
-    return info, None
+@memoize(10 * 60, cache_if=lambda result: result[1] is None)
+def get_recent_uploads(channel_id):
+    """Get the IDs of a channel's latest uploads, which include scheduled streams.
 
+    Reads the uploads playlist instead of ``search.list``, which costs 100
+    quota units per call against 1 here.
+    """
 
-@cached(cache=TTLCache(maxsize=512, ttl=timedelta(minutes=10), timer=datetime.now))
-def get_upcoming_live_videos(channel_id):
-    """Get upcoming live videos for a channel using channel ID."""
+    playlist_id, error = get_uploads_playlist_id(channel_id)
+    if error:
+        return None, error
 
-    logger.debug(f"Fetching upcoming live video for channel ID: {channel_id}")
+    logger.debug(f"Fetching recent uploads for channel ID: {channel_id}")
 
     args = {
-        "part": "snippet",
-        "channelId": channel_id,
-        "eventType": "upcoming",
-        "type": "video",
+        "part": "contentDetails",
+        "playlistId": playlist_id,
+        "maxResults": 10,
+        "fields": "items/contentDetails/videoId",
     }
     try:
-        request = youtube.search().list(**args)
+        request = youtube.playlistItems().list(**args)
         response = request.execute()
     except googleapiclient.errors.HttpError as e:
+        if e.resp.status == 404:
+            # Channels that never uploaded have no uploads playlist
+            logger.debug("No uploads playlist found")
+            return None, None
         logger.error(f"HTTP error occurred: {e}")
         return None, f"HTTP error occurred: {e}"
 
-    if not response.get("items"):
-        logger.debug("No upcoming live video found")
-        return None, None
+    video_ids = [item["contentDetails"]["videoId"] for item in response.get("items", [])]
+    logger.debug(f"Found {len(video_ids)} recent upload(s)")
+    return video_ids, None
 
-    video_ids = [item["id"]["videoId"] for item in response["items"]]
-    if not video_ids:
-        logger.debug("No video IDs found for live streaming details")
-        return None, "No video IDs found for live streaming details"
 
-    logger.debug(f"Found {len(video_ids)} upcoming live video(s)")
-    return video_ids, None
+# Seconds to cache each late status; UPCOMING scales with time until start
+LATE_STATUS_TTLS = {"NO_SCHEDULE": 30 * 60, "LIVE": 5 * 60, "LATE": 15, "UNKNOWN": 60}
+
+
+def late_status_ttl(status, until_start=None):
+    """Get how long a late status result should stay cached."""
+
+    if status == "UPCOMING" and until_start is not None:
+        return max(30, min(600, until_start / 4))
+    return LATE_STATUS_TTLS.get(status, 60)
+
+
+def parse_timestamp(ts):
+    """Convert a YouTube ``YYYY-MM-DDTHH:MM:SSZ`` timestamp to epoch seconds."""
+
+    return calendar.timegm(
+        (int(ts[0:4]), int(ts[5:7]), int(ts[8:10]), int(ts[11:13]), int(ts[14:16]), int(ts[17:19]), 0, 0, 0)
+    )
+
+
+# Every videos.list call has the same part and fields, so the request is built
+# from the discovery doc once and later calls only splice in the video IDs
+VIDEO_IDS_PLACEHOLDER = "VIDEO_IDS"
+videos_template = youtube.videos().list(part="liveStreamingDetails", id=VIDEO_IDS_PLACEHOLDER, fields=VIDEO_FIELDS)
+
+
+def videos_request(video_ids):
+    """Build a videos.list request for the given IDs from the template."""
+
+    uri = videos_template.uri.replace(
+        f"id={VIDEO_IDS_PLACEHOLDER}", "id=" + quote(",".join(video_ids), safe="")
+    )
+    return googleapiclient.http.HttpRequest(
+        videos_template.http,
+        videos_template.postproc,
+        uri,
+        method=videos_template.method,
+        headers=dict(videos_template.headers),  # execute() mutates headers
+        methodId=videos_template.methodId,
+    )
 
 
-@cached(cache=TTLCache(maxsize=512, ttl=timedelta(minutes=1), timer=datetime.now))
+@memoize(lambda result: result[2])
 def get_late_status(channel_id):
-    """Check if the channel is late for its live stream."""
+    """Check if the channel is late for its live stream.
+
+    Returns ``(status, error, ttl)``, where ``ttl`` is how long the result
+    stays cached.
+    """
 
     logger.debug(f"Checking late status for channel ID: {channel_id}")
 
-    video_ids, error = get_upcoming_live_videos(channel_id)
+    video_ids, error = get_recent_uploads(channel_id)
     if error:
-        return None, error
+        return None, error, late_status_ttl(None)
 
     if not video_ids:
-        logger.debug("No upcoming live videos found")
-        return "NO_SCHEDULE", None
+        logger.debug("No recent uploads found")
+        return "NO_SCHEDULE", None, late_status_ttl("NO_SCHEDULE")
 
-    request = youtube.videos().list(part="liveStreamingDetails", id=",".join(video_ids))
+    request = videos_request(video_ids)
     try:
         response = request.execute()
     except googleapiclient.errors.HttpError as e:
         logger.error(f"HTTP error occurred: {e}")
-        return None, f"HTTP error occurred: {e}"
+        return None, f"HTTP error occurred: {e}", late_status_ttl(None)
+
+    # Plain uploads have no liveStreamingDetails and ended streams don't count
+    details = [
+        item
+        for item in response.get("items", [])
+        if item.get("liveStreamingDetails") and not item["liveStreamingDetails"].get("actualEndTime")
+    ]
+    if not details:
+        logger.debug("No live or scheduled streams in recent uploads")
+        return "NO_SCHEDULE", None, late_status_ttl("NO_SCHEDULE")
 
-    details = response.get("items", [])
     logger.debug("Checking live streaming details for %d video(s)", len(details))
 
-    live_status = "UNKNOWN"
-    # Extract relevant details from live details
-    for item in details:
-        details = item.get("liveStreamingDetails", {})
-        if details.get("actualEndTime"):
-            logger.debug("Stream has ended for video ID: %s", item["id"])
-            continue  # Skip ended streams
-        elif details.get("actualStartTime"):
-            logger.debug("Stream is live for video ID: %s", item["id"])
-            return "LIVE", None
-        elif details.get("scheduledStartTime"):
-            start_time = datetime.strptime(details["scheduledStartTime"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-            logger.debug("Stream is scheduled for video ID: %s at %s", item["id"], str(start_time))
-            if start_time > datetime.now(timezone.utc) + timedelta(days=7):
-                logger.debug("Stream is not within the next week, skipping")
-                continue # Not within a week, skip
-            if start_time < datetime.now(timezone.utc):
-                return "LATE", None
-            else:
-                live_status = "UPCOMING"
+    live = next((item for item in details if item["liveStreamingDetails"].get("actualStartTime")), None)
+    if live:
+        logger.debug("Stream is live for video ID: %s", live["id"])
+        return "LIVE", None, late_status_ttl("LIVE")
+
+    # Only the earliest scheduled stream matters. YouTube timestamps share one
+    # UTC format, so the strings compare chronologically and only it is parsed
+    scheduled = (
+        (item["liveStreamingDetails"]["scheduledStartTime"], item["id"])
+        for item in details
+        if item["liveStreamingDetails"].get("scheduledStartTime")
+    )
+    earliest = min(scheduled, default=None)
+    if earliest:
+        now = time.time()
+        start_time = parse_timestamp(earliest[0])
+        logger.debug("Stream is scheduled for video ID: %s at %s", earliest[1], earliest[0])
+        if start_time > now + 7 * 86400:
+            logger.debug("Stream is not within the next week, skipping")
+        elif start_time < now:
+            return "LATE", None, late_status_ttl("LATE")
         else:
-            live_status = "UNKNOWN"
+            return "UPCOMING", None, late_status_ttl("UPCOMING", start_time - now)
+
+    return "UNKNOWN", None, late_status_ttl("UNKNOWN")
+
+
+@memoize(lambda result: result[2], cache_if=lambda result: result[1] == 200)
+def late_payload(channel):
+    """Build the /late response for a channel query.
+
+    Returns ``(payload, status_code, ttl)``. Successful payloads are cached
+    until the late status they carry expires, so a repeat query is served
+    from a single cache lookup.
+    """
+
+    channel_id, channel_info, error = resolve_channel(channel)
+    if error:
+        return {"query": channel, "error": error}, 500, 0
+
+    status, error, _ttl = get_late_status(channel_id)
+    if error:
+        return {"query": channel, "channel_id": channel_id, "error": error}, 500, 0
+
+    # The status may come from cache already part-way through its TTL
+    ttl = get_late_status.ttl_left(channel_id)
+
+    payload = {
+        "channel_id": channel_id,
+        "channel_name": channel_info["channel_name"],
+        "profile_pic": channel_info["profile_pic"],
+        "live_status": status,
+    }
+    return payload, 200, ttl
 
-    return live_status, None
 
 @app.route("/", methods=["GET"])
 def default():
-    return jsonify({"routes": ["late"]})
+    return ojson({"routes": ["late"]})
 
 @app.route("/late", methods=["GET"])
 def check_if_late():
     channel = request.args.get("channel")
     if not channel:
-        return jsonify({"error": "Missing YouTube channel argument"}), 400
-
-    channel_id, error = get_channel_id(channel)
-    if error:
-        return jsonify({"query": channel, "error": error}), 500
+        return ojson({"error": "Missing YouTube channel argument"}, 400)
 
-    channel_info, error = get_channel_info(channel_id)
-    if error:
-        return (
-            jsonify({"query": channel, "channel_id": channel_id, "error": error}),
-            500,
-        )
-
-    status, error = get_late_status(channel_id)
-    if error:
-        return (
-            jsonify({"query": channel, "channel_id": channel_id, "error": error}),
-            500,
-        )
-
-    return jsonify(
-        {
-            "channel_id": channel_id,
-            "channel_name": channel_info["channel_name"],
-            "profile_pic": channel_info["profile_pic"],
-            "live_status": status,
-        }
-    )
+    payload, status_code, _ttl = late_payload(channel)
+    return ojson(payload, status_code)
 
 
 if __name__ == "__main__":
-    """Run the Flask app"""
-    app.run(debug=True)
+    """Run the Flask app under gevent's WSGI server"""
+    from gevent.pywsgi import WSGIServer
+
+    WSGIServer(("0.0.0.0", 5000), app).serve_forever()